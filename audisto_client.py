@@ -4,8 +4,10 @@ Features:
 - Centralized base URL + API version constants
 - `requests.Session` with retry/backoff
 - In-process single-request lock (Audisto allows 1 request per key at a time)
+- Short-lived in-memory cache of parsed crawl status/summary responses
 - Chunk validation (max 10,000 items per request)
 - Helpers: `get_crawl_status_v2`, `get_crawl_summary_v2`, and a `iter_chunked` helper
+- `iter_chunked` prefetches the next page while the current one is being consumed
 
 IMPORTANT: The threading lock only enforces single-request ordering within ONE MCP instance.
 If you run multiple MCP servers with the same API key, you must ensure they do not send
@@ -13,16 +15,24 @@ requests simultaneously, or Audisto will return 429 (Too Many Requests) errors.
 """
 from __future__ import annotations
 
+import base64
+import contextlib
+import copy
 import logging
 import os
 import threading
-from typing import Any, Iterator
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ContextManager, Iterator, TypeVar, cast
 
+import orjson
 import requests
+from pydantic import ValidationError
 from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
 from urllib3.util.retry import Retry
 
-from models import CrawlStatusResponse, CrawlSummary
+from models import ChunkedResponse, CrawlStatusResponse, CrawlSummary
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -32,6 +42,24 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 DEFAULT_BASE = "https://api.audisto.com"
 DEFAULT_VERSION = os.getenv("AUDISTO_API_VERSION", "2.0")
+DEFAULT_CACHE_TTL = 60.0
+# Crawl lists with unfinished crawls go stale quickly, so they are kept for less time
+IN_PROGRESS_CACHE_TTL = 30.0
+CACHE_MAXSIZE = 256
+
+_T = TypeVar("_T")
+
+
+class _BasicAuthHeader(AuthBase):
+    """HTTP Basic Auth with the header value encoded once up front."""
+
+    def __init__(self, username: str, password: str) -> None:
+        token = base64.b64encode(f"{username}:{password}".encode("latin1")).decode("ascii")
+        self._header = f"Basic {token}"
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = self._header
+        return r
 
 
 class AudistoClient:
@@ -43,60 +71,208 @@ class AudistoClient:
         api_version: str = DEFAULT_VERSION,
         timeout: int = 120,
         max_retries: int = 3,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        serialize_requests: bool = True,
+        min_request_interval: float = 0.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_version = api_version
+        # Built once; every endpoint URL is this prefix plus the path
+        self._url_prefix = f"{self.base_url}/{api_version}"
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
 
         # Get credentials from parameters or environment
         final_api_key = api_key or os.getenv("AUDISTO_API_KEY")
         final_password = password or os.getenv("AUDISTO_PASSWORD")
 
-        # Store as tuple for requests auth (None if missing)
+        # Credentials as a tuple (None if missing)
         self.auth: tuple[str, str] | None = (
             (final_api_key, final_password)
             if final_api_key and final_password
             else None
         )
-        self._lock = threading.Lock()
+        # Serializes requests to honour Audisto's 1-request-per-key limit. Callers that
+        # already guarantee a single caller thread can opt out with serialize_requests=False.
+        self._lock: ContextManager[Any] = (
+            threading.Lock() if serialize_requests else contextlib.nullcontext()
+        )
+        # Client-side throttle: minimum seconds between request starts (0 disables)
+        self.min_request_interval = min_request_interval
+        # -inf so the first request is never delayed, however small time.monotonic() is
+        self._last_request_at = float("-inf")
+        # url -> (expires_at, parsed response), stored and handed out as copies;
+        # disabled when cache_ttl <= 0
+        self._cache: dict[str, tuple[float, Any]] = {}
+        # Guards _cache and _fill_locks; never held across a request
+        self._cache_lock = threading.Lock()
+        # url -> lock held while that url is being fetched, so concurrent misses share one request
+        self._fill_locks: dict[str, threading.Lock] = {}
 
         # Session with retries/backoff
         self.session = requests.Session()
+        if self.auth:
+            # Set once on the session instead of base64-encoding the pair on every request
+            self.session.auth = _BasicAuthHeader(*self.auth)
         retries = Retry(
             total=max_retries,
             backoff_factor=0.5,
             status_forcelist=(429, 500, 502, 503, 504),
             allowed_methods=("GET", "POST"),
+            respect_retry_after_header=True,
+            backoff_jitter=0.5,
+        )
+        # Size the pool explicitly so long `iter_chunked` runs keep reusing the
+        # same keep-alive connection instead of discarding it when the pool is full.
+        # Also mounted for http:// so a custom plain-HTTP base_url (e.g. a local
+        # proxy or mock server) keeps the same retry policy.
+        adapter = HTTPAdapter(
+            max_retries=retries,
+            pool_connections=4,
+            pool_maxsize=32,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retries)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
     def _url(self, path: str) -> str:
-        return f"{self.base_url}/{self.api_version}{path}"
+        return self._url_prefix + path
 
-    def get_crawl_status_v2(self) -> CrawlStatusResponse | dict[str, Any]:
+    def _get(self, url: str, params: dict[str, Any] | None = None) -> requests.Response:
+        """Send a GET under the single-request lock, throttled by `min_request_interval`."""
+        with self._lock:
+            if self.min_request_interval > 0:
+                wait = self._last_request_at + self.min_request_interval - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                self._last_request_at = time.monotonic()
+            resp = self.session.get(url, timeout=self.timeout, params=params)
+        resp.raise_for_status()
+        return resp
+
+    def _cache_get(self, key: str) -> Any | None:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._cache[key]
+                return None
+        # Results (pydantic models or the raw-dict fallback) are mutable, so each
+        # caller gets its own copy and can't change what the next caller sees
+        return copy.deepcopy(value)
+
+    def _cache_put(self, key: str, value: Any, ttl: float) -> None:
+        value = copy.deepcopy(value)
+        with self._cache_lock:
+            self._cache.pop(key, None)
+            if len(self._cache) >= CACHE_MAXSIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (time.monotonic() + ttl, value)
+
+    def _cached(
+        self,
+        key: str,
+        fetch: Callable[[], _T],
+        ttl_for: Callable[[_T], float] | None = None,
+    ) -> _T:
+        """Return the cached value for `key`, or call `fetch()` and cache its result.
+
+        Concurrent misses for the same key wait for the first fetch and reuse its
+        result instead of each sending a request. `ttl_for` picks the TTL from the
+        fetched value (default: `cache_ttl`).
+        """
+        if self.cache_ttl <= 0:
+            return fetch()
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug(f"Using cached response for {key}")
+            return cast(_T, cached)
+
+        with self._cache_lock:
+            fill_lock = self._fill_locks.setdefault(key, threading.Lock())
+        try:
+            with fill_lock:
+                # Another thread may have filled the entry while we waited
+                cached = self._cache_get(key)
+                if cached is not None:
+                    logger.debug(f"Using cached response for {key}")
+                    return cast(_T, cached)
+                value = fetch()
+                self._cache_put(key, value, self.cache_ttl if ttl_for is None else ttl_for(value))
+                return value
+        finally:
+            with self._cache_lock:
+                if self._fill_locks.get(key) is fill_lock:
+                    del self._fill_locks[key]
+
+    def get_crawl_status_v2(self, limit: int | None = None) -> CrawlStatusResponse | dict[str, Any]:
         """Retrieve list of recent crawls (v2).
 
-        Returns a validated CrawlStatusResponse model or raw dict if validation fails.
-        """
-        url = self._url("/status/crawls")
-        logger.debug(f"Fetching crawl status from {url}")
+        Args:
+            limit: Only fetch the first `limit` crawls (sent as `chunksize`, max 10,000).
+                Fetches the API's default page when omitted.
 
-        with self._lock:
-            resp = self.session.get(url, auth=self.auth, timeout=self.timeout)
-        resp.raise_for_status()
+        Returns a validated CrawlStatusResponse model or raw dict if validation fails.
+        Results are cached for `cache_ttl` seconds, or at most `IN_PROGRESS_CACHE_TTL`
+        seconds while any listed crawl is not finished.
 
-        data: Any = resp.json()
-        logger.info("Successfully fetched crawl status")
+        Raises:
+            ValueError: If limit is outside 1..10,000
+            RuntimeError: If the response body is not valid JSON
+        """
+        params: dict[str, Any] | None = None
+        if limit is not None:
+            if limit < 1 or limit > 10000:
+                raise ValueError(f"limit must be between 1 and 10,000 (got {limit})")
+            params = {"chunksize": limit}
 
+        url = self._url("/status/crawls")
+        cache_key = url if params is None else f"{url}?chunksize={limit}"
+
+        def fetch() -> CrawlStatusResponse | dict[str, Any]:
+            logger.debug(f"Fetching crawl status from {url}")
+            resp = self._get(url, params)
+
+            # orjson decodes the raw bytes directly, skipping requests' str decode + stdlib json.
+            # orjson.JSONDecodeError is a ValueError, which callers read as bad input, so
+            # surface an undecodable body as RuntimeError like _fetch_chunk does
+            try:
+                data: Any = orjson.loads(resp.content)
+            except orjson.JSONDecodeError as e:
+                raise RuntimeError("Unexpected crawl status response format") from e
+            logger.info("Successfully fetched crawl status")
+            return self._parse_crawl_status(data)
+
+        return self._cached(cache_key, fetch, self._crawl_status_ttl)
+
+    def _crawl_status_ttl(self, result: CrawlStatusResponse | dict[str, Any]) -> float:
+        # Unfinished crawls change state soon, so don't serve them for the full cache_ttl
+        if isinstance(result, CrawlStatusResponse):
+            statuses = [item.status for item in result.items]
+        else:
+            items = result.get("items")
+            statuses = (
+                [item.get("status") for item in items if isinstance(item, dict)]
+                if isinstance(items, list)
+                else []
+            )
+        if any(status != "finished" for status in statuses):
+            return min(self.cache_ttl, IN_PROGRESS_CACHE_TTL)
+        return self.cache_ttl
+
+    @staticmethod
+    def _parse_crawl_status(data: Any) -> CrawlStatusResponse | dict[str, Any]:
         # Try to validate with Pydantic, fall back to raw dict if format differs
         try:
             if isinstance(data, dict) and "items" in data:
-                return CrawlStatusResponse(**data)
+                return CrawlStatusResponse.model_validate(data)
             elif isinstance(data, list):
                 # If API returns a list directly, wrap it
-                return CrawlStatusResponse(items=data)
+                return CrawlStatusResponse.model_validate({"items": data})
             # Return as dict if not handled above
             return dict(data) if not isinstance(data, dict) else data
         except Exception as e:
@@ -107,33 +283,58 @@ class AudistoClient:
     def get_crawl_summary_v2(self, crawl_id: int) -> CrawlSummary:
         """Retrieve crawl details for a given crawl id (v2).
 
-        Returns a validated CrawlSummary model.
+        Returns a validated CrawlSummary model. Results are cached for `cache_ttl` seconds.
 
         Raises:
             ValueError: If crawl_id is invalid
             requests.exceptions.HTTPError: If API request fails
+            RuntimeError: If the response body is not a valid crawl summary
         """
         if not isinstance(crawl_id, int) or crawl_id < 0:
             raise ValueError("crawl_id must be a positive integer")
 
         url = self._url(f"/crawls/{crawl_id}")
-        logger.debug(f"Fetching crawl summary for ID {crawl_id} from {url}")
 
-        with self._lock:
-            resp = self.session.get(url, auth=self.auth, timeout=self.timeout)
-        resp.raise_for_status()
+        def fetch() -> CrawlSummary:
+            logger.debug(f"Fetching crawl summary for ID {crawl_id} from {url}")
+            resp = self._get(url)
+
+            # Validate straight from the raw bytes: pydantic-core parses and validates
+            # in one pass without building an intermediate dict. ValidationError is a
+            # ValueError, which callers read as bad input, so re-raise it as RuntimeError
+            try:
+                summary = CrawlSummary.model_validate_json(resp.content)
+            except ValidationError as e:
+                raise RuntimeError("Unexpected crawl summary response format") from e
+            logger.info(f"Successfully fetched crawl summary for ID {crawl_id}")
+            return summary
+
+        return self._cached(url, fetch)
 
-        data = resp.json()
-        logger.info(f"Successfully fetched crawl summary for ID {crawl_id}")
+    def _fetch_chunk(self, url: str, params: dict[str, Any]) -> ChunkedResponse:
+        """Fetch and decode a single page of a chunked endpoint."""
+        resp = self._get(url, params)
 
-        return CrawlSummary(**data)
+        # Decode straight into the typed envelope; schema mismatches surface as ValidationError
+        try:
+            return ChunkedResponse.model_validate_json(resp.content)
+        except ValidationError as e:
+            raise RuntimeError("Unexpected chunked response format") from e
 
     def iter_chunked(self, path: str, chunksize: int = 100, **params: Any) -> Iterator[dict[str, Any]]:
         """Iterate over chunked endpoints.
 
+        The next page is requested in a background thread while the caller consumes
+        the current one. Only one request is ever in flight, so Audisto's
+        1-request-per-key limit still holds. If the caller stops early (``close()``,
+        ``break`` or garbage collection), at most one extra request for the next page
+        has already been sent; it completes in the background without blocking the
+        caller, and its result is discarded.
+
         Args:
             path: API endpoint path, e.g., "/crawls/{id}/pages/"
-            chunksize: Number of items per chunk (default 100, max 10,000 per Audisto API limits)
+            chunksize: Number of items per chunk (default 100, max 10,000 per Audisto API limits).
+                Each chunk is one round trip, so large exports should use a larger chunksize.
             **params: Additional query parameters
 
         Yields:
@@ -150,36 +351,55 @@ class AudistoClient:
         logger.debug(f"Starting chunked iteration on {path} with chunksize={chunksize}")
         page = 0
         total_items = 0
+        # Only the chunk number changes between pages
+        url = self._url(path)
+        base_params: dict[str, Any] = {**params, "chunksize": chunksize}
 
-        while True:
-            p = dict(params)
-            p.update({"chunk": page, "chunksize": chunksize})
-            url = self._url(path)
-
-            with self._lock:
-                resp = self.session.get(url, auth=self.auth, timeout=self.timeout, params=p)
-            resp.raise_for_status()
-
-            data = resp.json()
-            if not isinstance(data, dict):
-                raise RuntimeError("Unexpected chunked response format")
-
-            items = data.get("items", [])
-            total_items += len(items)
-            logger.debug(f"Fetched page {page}: {len(items)} items (total so far: {total_items})")
-
-            yield from items
-
-            chunk_meta = data.get("chunk", {})
-            total = chunk_meta.get("total")
-            size = chunk_meta.get("size")
-            page = chunk_meta.get("page", page)
-
-            # Stop if we have no items or we've reached the last page
-            if not items or total is None or (size is not None and (page + 1) * size >= total):
-                logger.info(f"Completed chunked iteration: {total_items} total items")
-                break
-            page += 1
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = prefetcher.submit(self._fetch_chunk, url, {**base_params, "chunk": page})
+
+            while True:
+                data = pending.result()
+
+                items = data.items
+                total_items += len(items)
+                logger.debug(f"Fetched page {page}: {len(items)} items (total so far: {total_items})")
+
+                meta = data.chunk
+                if meta.page is not None:
+                    page = meta.page
+                if not items or meta.total is None:
+                    last_page = True
+                elif meta.size is not None:
+                    # Trust the metadata over chunksize: the API may cap pages below it,
+                    # so a short page is not necessarily the last one
+                    last_page = (page + 1) * meta.size >= meta.total
+                else:
+                    # No page size to compare against the total; only a short page ends it
+                    last_page = len(items) < chunksize
+
+                if not last_page:
+                    # Request the next page before handing this one to the caller
+                    page += 1
+                    pending = prefetcher.submit(
+                        self._fetch_chunk, url, {**base_params, "chunk": page}
+                    )
+
+                # Hand items over one at a time and drop the page's reference to each, so
+                # consumed items can be freed while the next page is being decoded instead
+                # of keeping two full pages alive
+                items.reverse()
+                while items:
+                    yield items.pop()
+
+                if last_page:
+                    logger.info(f"Completed chunked iteration: {total_items} total items")
+                    break
+        finally:
+            # Don't block close() or GC on a prefetch the caller no longer needs; an
+            # in-flight request finishes in the background and its result is dropped
+            prefetcher.shutdown(wait=False, cancel_futures=True)
 
 
 __all__ = ["AudistoClient"]
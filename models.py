@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -29,3 +29,9 @@ class ChunkMeta(BaseModel):
     total: Optional[int] = None
     page: Optional[int] = None
     size: Optional[int] = None
+
+
+class ChunkedResponse(BaseModel):
+    """Envelope of a chunked endpoint response: one page of items plus pagination metadata."""
+    items: List[Dict[str, Any]] = Field(default_factory=list)
+    chunk: ChunkMeta = Field(default_factory=ChunkMeta)
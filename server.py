@@ -6,10 +6,12 @@ Description: A Model Context Protocol server for connecting AI agents to Audisto
 Read-only: This MCP acts only as a read-only adapter to Audisto's API. It does not provide any tools to start, stop, or modify crawls.
 """
 
+import asyncio
+import functools
 import logging
 import os
 import sys
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 
 import requests
 from fastmcp import FastMCP
@@ -31,6 +33,12 @@ mcp = FastMCP("Audisto SEO Agent")
 
 # Constants
 MAX_CRAWLS_DISPLAYED = 5
+STATUS_ICONS = {"finished": "✓"}  # any other status is shown as in progress (⋯)
+
+# Credentials are read from the environment once at import time
+_API_KEY = os.getenv("AUDISTO_API_KEY")
+_PASSWORD = os.getenv("AUDISTO_PASSWORD")  # Audisto uses this as the 'password' in Basic Auth
+_AUTH: Optional[Tuple[str, str]] = (_API_KEY, _PASSWORD) if _API_KEY and _PASSWORD else None
 
 # --- Helper Functions ---
 
@@ -65,7 +73,7 @@ def handle_api_error(e: Exception, context: str = "") -> str:
         logger.exception(f"{context} - Unexpected error: {str(e)}")
         return "Error: An unexpected error occurred"
 def get_auth() -> Tuple[str, str]:
-    """Retrieves credentials safely from environment variables.
+    """Retrieves credentials read from environment variables at import time.
 
     Returns:
         Tuple[str, str]: (api_key, password) for Basic Auth
@@ -73,18 +81,20 @@ def get_auth() -> Tuple[str, str]:
     Raises:
         ValueError: If AUDISTO_API_KEY or AUDISTO_PASSWORD are not set
     """
-    api_key = os.getenv("AUDISTO_API_KEY")
-    password = os.getenv("AUDISTO_PASSWORD")  # Audisto uses this as the 'password' in Basic Auth
-
-    if not api_key or not password:
+    if _AUTH is None:
         logger.error("Missing required environment variables: AUDISTO_API_KEY and/or AUDISTO_PASSWORD")
         raise ValueError("Missing Credentials! Please set AUDISTO_API_KEY and AUDISTO_PASSWORD in your environment.")
 
-    return (api_key, password)
+    return _AUTH
 
 
+@functools.lru_cache(maxsize=1)
 def get_client() -> AudistoClient:
-    """Construct an AudistoClient using current environment credentials."""
+    """Return the shared AudistoClient, building it on first use.
+
+    Reusing the client keeps its `requests.Session` (and the pooled keep-alive
+    connection to api.audisto.com) alive across tool invocations.
+    """
     api_key, password = get_auth()
     return AudistoClient(api_key=api_key, password=password)
 
@@ -126,55 +136,49 @@ Tips:
     return help_text.strip()
 
 @mcp.tool()
-def get_crawl_status() -> str:
+async def get_crawl_status() -> str:
     """
     Check the status of recent Audisto crawls.
     Returns the ID, status, and domain of the last 5 crawls.
     """
     try:
         client = get_client()
-        response = client.get_crawl_status_v2()
+        # Run the blocking HTTP call in a worker thread so the event loop stays free.
+        # Only the crawls we display are requested from Audisto.
+        response = await asyncio.to_thread(client.get_crawl_status_v2, MAX_CRAWLS_DISPLAYED)
 
-        # Handle both Pydantic model and raw dict responses
-        crawls: List[Any] = []
+        # Pick the response shape once, then format every row the same way
+        rows: List[Tuple[Any, Any, Any]]
         if isinstance(response, CrawlStatusResponse):
-            # CrawlStatusResponse Pydantic model
-            crawls = response.items[:MAX_CRAWLS_DISPLAYED]
+            rows = [(c.id, c.domain, c.status) for c in response.items[:MAX_CRAWLS_DISPLAYED]]
         else:
             # Raw dict with 'items' key
             items = response.get('items', [])
             crawls = items[:MAX_CRAWLS_DISPLAYED] if isinstance(items, list) else []
+            rows = [
+                (c.get('id'), c.get('domain'), c.get('status')) if isinstance(c, dict)
+                else (None, None, None)
+                for c in crawls
+            ]
 
-        if not crawls:
+        if not rows:
             logger.info("No recent crawls found in Audisto")
             return "No recent crawls found."
 
-        summary = [f"Here are the latest {MAX_CRAWLS_DISPLAYED} Audisto crawls:"]
-        for crawl in crawls:
-            # Handle both Pydantic models and dicts
-            if hasattr(crawl, 'id'):
-                # Pydantic model
-                crawl_id = crawl.id
-                domain = crawl.domain
-                status = crawl.status
-            else:
-                # Dict
-                crawl_id = crawl.get('id') if isinstance(crawl, dict) else None
-                domain = crawl.get('domain') if isinstance(crawl, dict) else None
-                status = crawl.get('status') if isinstance(crawl, dict) else None
-
-            status_icon = "✓" if status == 'finished' else "⋯"
-            summary.append(f"[{status_icon}] ID: {crawl_id} | Domain: {domain} | Status: {status}")
+        lines = "\n".join(
+            f"[{STATUS_ICONS.get(status, '⋯')}] ID: {crawl_id} | Domain: {domain} | Status: {status}"
+            for crawl_id, domain, status in rows
+        )
 
         logger.info("Successfully retrieved crawls from Audisto API")
-        return "\n".join(summary)
+        return f"Here are the latest {MAX_CRAWLS_DISPLAYED} Audisto crawls:\n{lines}"
 
     except Exception as e:
         return handle_api_error(e, "get_crawl_status")
 
 
 @mcp.tool()
-def get_crawl_summary(crawl_id: int) -> str:
+async def get_crawl_summary(crawl_id: int) -> str:
     """
     Get the high-level summary of a specific crawl.
     Use this to see how many pages were crawled vs. ignored.
@@ -183,7 +187,7 @@ def get_crawl_summary(crawl_id: int) -> str:
     """
     try:
         client = get_client()
-        data = client.get_crawl_summary_v2(crawl_id)
+        data = await asyncio.to_thread(client.get_crawl_summary_v2, crawl_id)
 
         # Data is always a CrawlSummary Pydantic model
         summary = (f"Crawl Summary for ID {crawl_id}:\n"
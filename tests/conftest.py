@@ -0,0 +1,25 @@
+"""Shared fixtures for the client tests.
+
+Every test mocks its own HTTP traffic with `responses` and touches no files or
+real network, so the suite is safe to run in parallel with `pytest -n auto`
+(pytest-xdist). Session-scoped fixtures are created once per xdist worker.
+"""
+import pytest
+
+from audisto_client import AudistoClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared AudistoClient for tests that don't need a custom configuration.
+
+    Caching is disabled so mocked responses never leak between tests.
+    """
+    return AudistoClient(api_key="k", password="p", cache_ttl=0)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make retry backoff and client throttling sleeps instant in every test."""
+    monkeypatch.setattr("urllib3.util.retry.Retry.sleep", lambda *args, **kwargs: None)
+    monkeypatch.setattr("time.sleep", lambda *args, **kwargs: None)
@@ -1,146 +1,499 @@
+import contextlib
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import orjson
 import pytest
-import requests
 import responses
+from requests.exceptions import HTTPError, RetryError
+from responses import matchers
 
 from audisto_client import AudistoClient
 from models import CrawlStatusResponse, CrawlSummary
 
+_BASE_URL = "https://api.audisto.com/2.0"
+_URL_CRAWL_123 = f"{_BASE_URL}/crawls/123"
+_URL_CRAWL_999 = f"{_BASE_URL}/crawls/999"
+_URL_STATUS_CRAWLS = f"{_BASE_URL}/status/crawls"
+_PAGES_PATH = "/crawls/1/pages/"
+_URL_PAGES = _BASE_URL + _PAGES_PATH
+
+_SUMMARY_PAYLOAD = {"domain": "example.com", "crawled_pages": 42, "max_depth": 5, "start_time": "2024-01-01"}
+_EXPECTED_SUMMARY = CrawlSummary(
+    domain="example.com", crawled_pages=42, max_depth=5, start_time="2024-01-01"
+)
+
+# Pre-encoded pages of a 3-item chunked listing (chunksize=2), keyed by chunk number
+_PAGES = {
+    0: orjson.dumps({"chunk": {"total": 3, "page": 0, "size": 2}, "items": [{"id": 1}, {"id": 2}]}),
+    1: orjson.dumps({"chunk": {"total": 3, "page": 1, "size": 2}, "items": [{"id": 3}]}),
+}
+
+# Crawl list shared by the crawl status tests
+_STATUS_ITEMS = (
+    {"id": 1, "domain": "example.com", "status": "finished"},
+    {"id": 2, "domain": "test.com", "status": "in_progress"},
+)
+
+
+def _chunk_of(request):
+    """Chunk number a mocked request for a chunked endpoint asked for."""
+    return int(parse_qs(urlparse(request.url).query)["chunk"][0])
+
+
+class TestCrawlSummaryV2:
+    """get_crawl_summary_v2 against a success (123) and a not-found (999) crawl."""
+
+    @pytest.fixture(autouse=True)
+    def _mocks(self):
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+            rsps.add(rsps.GET, _URL_CRAWL_123, json=_SUMMARY_PAYLOAD, status=200)
+            rsps.add(rsps.GET, _URL_CRAWL_999, status=404)
+            yield rsps
+
+    def test_success(self, client):
+        """Test successful crawl summary retrieval."""
+        data = client.get_crawl_summary_v2(123)
+        assert isinstance(data, CrawlSummary)
+        assert data == _EXPECTED_SUMMARY
 
-def test_get_crawl_summary_v2_success():
-    """Test successful crawl summary retrieval."""
-    client = AudistoClient(api_key="k", password="p")
-    crawl_id = 123
-    url = f"https://api.audisto.com/2.0/crawls/{crawl_id}"
-    payload = {"domain": "example.com", "crawled_pages": 42, "max_depth": 5, "start_time": "2024-01-01"}
+    def test_not_found(self, client):
+        """Test 404 error handling for non-existent crawl."""
+        with pytest.raises(HTTPError):
+            client.get_crawl_summary_v2(999)
 
-    with responses.RequestsMock() as rsps:
-        rsps.add(rsps.GET, url, json=payload, status=200)
-        data = client.get_crawl_summary_v2(crawl_id)
-        assert isinstance(data, CrawlSummary)
-        assert data.domain == "example.com"
-        assert data.crawled_pages == 42
+    @pytest.mark.parametrize("crawl_id", [-1, "not_an_int"], ids=["negative", "non_integer"])
+    def test_invalid_id(self, client, crawl_id):
+        """Test validation error for negative or non-integer crawl IDs."""
+        with pytest.raises(ValueError) as exc:
+            client.get_crawl_summary_v2(crawl_id)
+        assert str(exc.value) == "crawl_id must be a positive integer"
 
 
-def test_get_crawl_summary_v2_not_found():
-    """Test 404 error handling for non-existent crawl."""
-    client = AudistoClient(api_key="k", password="p")
-    crawl_id = 999
-    url = f"https://api.audisto.com/2.0/crawls/{crawl_id}"
+@responses.activate(assert_all_requests_are_fired=True)
+def test_client_sends_basic_auth_header(client):
+    """Test the precomputed Basic Auth header is sent with each request."""
+    responses.add(responses.GET, _URL_CRAWL_123, json={"domain": "example.com"}, status=200)
+    client.get_crawl_summary_v2(123)
+    assert responses.calls[0].request.headers["Authorization"] == "Basic azpw"
 
-    with responses.RequestsMock() as rsps:
-        rsps.add(rsps.GET, url, status=404)
-        with pytest.raises(requests.exceptions.HTTPError):
-            client.get_crawl_summary_v2(crawl_id)
 
+@responses.activate(assert_all_requests_are_fired=True)
+def test_client_reuses_single_session(client):
+    """Test requests share one Session and its pooled HTTPS adapter (keep-alive reuse)."""
+    session = client.session
+    adapter = session.get_adapter(_URL_CRAWL_123)
 
-def test_get_crawl_summary_v2_invalid_id_negative():
-    """Test validation error for negative crawl ID."""
-    client = AudistoClient(api_key="k", password="p")
-    with pytest.raises(ValueError, match="crawl_id must be a positive integer"):
-        client.get_crawl_summary_v2(-1)
+    responses.add(responses.GET, _URL_CRAWL_123, json=_SUMMARY_PAYLOAD, status=200)
+    responses.add(responses.GET, _URL_CRAWL_123, json=_SUMMARY_PAYLOAD, status=200)
+    client.get_crawl_summary_v2(123)
+    client.get_crawl_summary_v2(123)
 
+    assert len(responses.calls) == 2
+    assert client.session is session
+    assert session.get_adapter(_URL_CRAWL_123) is adapter
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    # Plain-HTTP base URLs (local proxies, mock servers) get the same retrying adapter
+    assert session.get_adapter("http://localhost:8080/2.0/crawls/123") is adapter
 
-def test_get_crawl_summary_v2_invalid_id_non_integer():
-    """Test validation error for non-integer crawl ID."""
-    client = AudistoClient(api_key="k", password="p")
-    with pytest.raises(ValueError, match="crawl_id must be a positive integer"):
-        client.get_crawl_summary_v2("not_an_int")  # type: ignore
 
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_summary_v2_non_json_body(client):
+    """Test a 200 response that is not JSON (e.g. a maintenance page) raises RuntimeError."""
+    responses.add(
+        responses.GET, _URL_CRAWL_123, body="<html>Maintenance</html>", status=200, content_type="text/html"
+    )
 
-def test_get_crawl_status_v2_success_with_items():
-    """Test successful crawl status retrieval with items format."""
+    with pytest.raises(RuntimeError) as exc:
+        client.get_crawl_summary_v2(123)
+    assert str(exc.value) == "Unexpected crawl summary response format"
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_summary_v2_cached():
+    """Test repeated crawl summary lookups are served from the cache."""
     client = AudistoClient(api_key="k", password="p")
-    url = "https://api.audisto.com/2.0/status/crawls"
-    payload = {
-        "items": [
-            {"id": 1, "domain": "example.com", "status": "finished"},
-            {"id": 2, "domain": "test.com", "status": "in_progress"}
-        ]
-    }
-
-    with responses.RequestsMock() as rsps:
-        rsps.add(rsps.GET, url, json=payload, status=200)
-        data = client.get_crawl_status_v2()
-        assert isinstance(data, CrawlStatusResponse)
-        assert len(data.items) == 2
-        assert data.items[0].domain == "example.com"
-
-
-def test_get_crawl_status_v2_success_with_list():
-    """Test successful crawl status retrieval with direct list format."""
+    payload = {"domain": "example.com", "crawled_pages": 42}
+
+    responses.add(responses.GET, _URL_CRAWL_123, json=payload, status=200)
+    first = client.get_crawl_summary_v2(123)
+    second = client.get_crawl_summary_v2(123)
+    assert second == first
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("body", "mutate"),
+    [
+        ({"items": list(_STATUS_ITEMS)}, lambda data: data.items.clear()),
+        ({"unexpected": [1]}, lambda data: data["unexpected"].clear()),
+    ],
+    ids=["model", "raw_dict"],
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_cache_hands_out_copies(body, mutate):
+    """Test mutating a returned result doesn't change what later cache hits return."""
     client = AudistoClient(api_key="k", password="p")
-    url = "https://api.audisto.com/2.0/status/crawls"
-    payload = [
-        {"id": 1, "domain": "example.com", "status": "finished"},
-        {"id": 2, "domain": "test.com", "status": "in_progress"}
-    ]
+    responses.add(responses.GET, _URL_STATUS_CRAWLS, json=body, status=200)
 
-    with responses.RequestsMock() as rsps:
-        rsps.add(rsps.GET, url, json=payload, status=200)
-        data = client.get_crawl_status_v2()
-        # Should wrap list in CrawlStatusResponse
-        assert isinstance(data, CrawlStatusResponse)
-        assert len(data.items) == 2
+    # The first result comes from the fetch, the second from a cache hit
+    mutate(client.get_crawl_status_v2())
+    mutate(client.get_crawl_status_v2())
+    assert client.get_crawl_status_v2() == client._parse_crawl_status(body)
+    assert len(responses.calls) == 1
 
 
-def test_get_crawl_status_v2_rate_limit():
-    """Test 429 rate limit error handling with retry exhaustion."""
-    client = AudistoClient(api_key="k", password="p")
-    url = "https://api.audisto.com/2.0/status/crawls"
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for cache expiry tests; advance with clock[0] += seconds."""
+    now = [1000.0]
+    monkeypatch.setattr("audisto_client.time.monotonic", lambda: now[0])
+    return now
 
-    with responses.RequestsMock() as rsps:
-        # Note: The retry adapter will retry 429s, so we need to add multiple responses
-        rsps.add(rsps.GET, url, status=429)
-        rsps.add(rsps.GET, url, status=429)
-        rsps.add(rsps.GET, url, status=429)
-        rsps.add(rsps.GET, url, status=429)  # Final retry
 
-        # When retries are exhausted, RetryError is raised instead of HTTPError
-        with pytest.raises(requests.exceptions.RetryError):
-            client.get_crawl_status_v2()
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_summary_v2_cache_expires(clock):
+    """Test a cached crawl summary is refetched once cache_ttl has passed."""
+    client = AudistoClient(api_key="k", password="p", cache_ttl=60)
+    responses.add(responses.GET, _URL_CRAWL_123, json={"domain": "old.com"}, status=200)
+    responses.add(responses.GET, _URL_CRAWL_123, json={"domain": "new.com"}, status=200)
 
+    assert client.get_crawl_summary_v2(123).domain == "old.com"
+    clock[0] += 59
+    assert client.get_crawl_summary_v2(123).domain == "old.com"
+    clock[0] += 1
+    assert client.get_crawl_summary_v2(123).domain == "new.com"
+    assert len(responses.calls) == 2
 
-def test_iter_chunked_stops():
-    """Test chunked iteration stops at correct boundary."""
-    client = AudistoClient(api_key="k", password="p")
-    path = "/crawls/1/pages/"
-    url = "https://api.audisto.com/2.0" + path
-
-    # first chunk
-    first = {"chunk": {"total": 3, "page": 0, "size": 2}, "items": [{"id": 1}, {"id": 2}]}
-    second = {"chunk": {"total": 3, "page": 1, "size": 2}, "items": [{"id": 3}]}
 
-    with responses.RequestsMock() as rsps:
-        rsps.add(rsps.GET, url, json=first, status=200)
-        rsps.add(rsps.GET, url, json=second, status=200)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_summary_v2_cache_disabled(client):
+    """Test cache_ttl=0 sends every lookup to the API and stores nothing."""
+    responses.add(responses.GET, _URL_CRAWL_123, json=_SUMMARY_PAYLOAD, status=200)
 
-        items = list(client.iter_chunked(path, chunksize=2))
-        assert len(items) == 3
+    client.get_crawl_summary_v2(123)
+    client.get_crawl_summary_v2(123)
+    assert len(responses.calls) == 2
+    assert client._cache == {}
 
 
-def test_iter_chunked_invalid_chunksize_too_large():
-    """Test validation error for chunk size exceeding API limit."""
+@responses.activate(assert_all_requests_are_fired=True)
+def test_cache_evicts_oldest_entry_at_maxsize(monkeypatch):
+    """Test the oldest entry is evicted once CACHE_MAXSIZE entries are cached."""
+    monkeypatch.setattr("audisto_client.CACHE_MAXSIZE", 2)
     client = AudistoClient(api_key="k", password="p")
-    with pytest.raises(ValueError, match="chunksize must be between 1 and 10,000"):
-        list(client.iter_chunked("/crawls/1/pages", chunksize=20000))
+    for crawl_id in (1, 2, 3):
+        responses.add(responses.GET, f"{_BASE_URL}/crawls/{crawl_id}", json={"id": crawl_id}, status=200)
+
+    for crawl_id in (1, 2, 3):
+        client.get_crawl_summary_v2(crawl_id)
+    assert list(client._cache) == [f"{_BASE_URL}/crawls/2", f"{_BASE_URL}/crawls/3"]
+
+    client.get_crawl_summary_v2(1)
+    assert len(responses.calls) == 4
 
 
-def test_iter_chunked_invalid_chunksize_zero():
-    """Test validation error for zero chunk size."""
+@responses.activate(assert_all_requests_are_fired=True)
+def test_cache_concurrent_misses_share_one_request():
+    """Test a lookup that misses while the same URL is being fetched waits for that fetch."""
     client = AudistoClient(api_key="k", password="p")
-    with pytest.raises(ValueError, match="chunksize must be between 1 and 10,000"):
-        list(client.iter_chunked("/crawls/1/pages", chunksize=0))
+    first_request_started = threading.Event()
+    release_response = threading.Event()
+
+    def slow_summary(request):
+        first_request_started.set()
+        release_response.wait(timeout=5)
+        return 200, {}, orjson.dumps(_SUMMARY_PAYLOAD)
+
+    responses.add_callback(
+        responses.GET, _URL_CRAWL_123, callback=slow_summary, content_type="application/json"
+    )
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get_crawl_summary_v2(123)))]
+    threads[0].start()
+    assert first_request_started.wait(timeout=5)
+    threads.append(threading.Thread(target=lambda: results.append(client.get_crawl_summary_v2(123))))
+    threads[1].start()
+    release_response.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == [_EXPECTED_SUMMARY, _EXPECTED_SUMMARY]
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("statuses", "ttl"),
+    [(("finished", "finished"), 60), (("finished", "in_progress"), 30)],
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_status_v2_cache_ttl_for_unfinished_crawls(clock, statuses, ttl):
+    """Test crawl lists with unfinished crawls are cached for the shorter in-progress TTL."""
+    client = AudistoClient(api_key="k", password="p", cache_ttl=60)
+    items = [{"id": i, "status": status} for i, status in enumerate(statuses)]
+    responses.add(responses.GET, _URL_STATUS_CRAWLS, json={"items": items}, status=200)
+
+    client.get_crawl_status_v2()
+    clock[0] += ttl - 1
+    client.get_crawl_status_v2()
+    assert len(responses.calls) == 1
+    clock[0] += 1
+    client.get_crawl_status_v2()
+    assert len(responses.calls) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_status_v2_success_with_items(client):
+    """Test successful crawl status retrieval with items format."""
+    body = orjson.dumps({"items": _STATUS_ITEMS})
+
+    responses.add(
+        responses.GET, _URL_STATUS_CRAWLS, body=body, status=200, content_type="application/json"
+    )
+    data = client.get_crawl_status_v2()
+    assert isinstance(data, CrawlStatusResponse)
+    assert len(data.items) == 2
+    assert data.items[0].domain == "example.com"
+
 
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_status_v2_success_with_list(client):
+    """Test successful crawl status retrieval with direct list format."""
+    body = orjson.dumps(_STATUS_ITEMS)
+
+    responses.add(
+        responses.GET, _URL_STATUS_CRAWLS, body=body, status=200, content_type="application/json"
+    )
+    data = client.get_crawl_status_v2()
+    # Should wrap list in CrawlStatusResponse
+    assert isinstance(data, CrawlStatusResponse)
+    assert len(data.items) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_status_v2_non_json_body(client):
+    """Test a 200 response that is not JSON (e.g. a maintenance page) raises RuntimeError."""
+    responses.add(
+        responses.GET, _URL_STATUS_CRAWLS, body="<html>Maintenance</html>", status=200, content_type="text/html"
+    )
+
+    with pytest.raises(RuntimeError) as exc:
+        client.get_crawl_status_v2()
+    assert str(exc.value) == "Unexpected crawl status response format"
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_status_v2_limit(client):
+    """Test the crawl list limit is sent to the API as chunksize."""
+    payload = {"items": [{"id": 1, "domain": "example.com", "status": "finished"}]}
+
+    responses.add(
+        responses.GET,
+        _URL_STATUS_CRAWLS,
+        json=payload,
+        status=200,
+        match=[matchers.query_param_matcher({"chunksize": "5"})],
+    )
+    data = client.get_crawl_status_v2(limit=5)
+    assert isinstance(data, CrawlStatusResponse)
+    assert len(data.items) == 1
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_crawl_status_v2_rate_limit(client):
+    """Test 429 rate limit error handling with retry exhaustion."""
 
-def test_iter_chunked_unexpected_response_format():
+    # Note: The retry adapter will retry 429s, so we need to add multiple responses
+    responses.add(responses.GET, _URL_STATUS_CRAWLS, status=429)
+    responses.add(responses.GET, _URL_STATUS_CRAWLS, status=429)
+    responses.add(responses.GET, _URL_STATUS_CRAWLS, status=429)
+    responses.add(responses.GET, _URL_STATUS_CRAWLS, status=429)  # Final retry
+
+    # When retries are exhausted, RetryError is raised instead of HTTPError
+    with pytest.raises(RetryError):
+        client.get_crawl_status_v2()
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_stops(client):
+    """Test chunked iteration stops at correct boundary without requesting past the last page."""
+    def page_for_chunk(request):
+        return 200, {}, _PAGES[_chunk_of(request)]
+
+    responses.add_callback(
+        responses.GET, _URL_PAGES, callback=page_for_chunk, content_type="application/json"
+    )
+
+    items = list(client.iter_chunked(_PAGES_PATH, chunksize=2))
+    assert [item["id"] for item in items] == [1, 2, 3]
+    assert len(responses.calls) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_prefetches_next_page(client):
+    """Test page N+1 is requested before page N's last item is yielded."""
+    next_page_requested = threading.Event()
+
+    def page_for_chunk(request):
+        chunk = _chunk_of(request)
+        if chunk == 1:
+            next_page_requested.set()
+        return 200, {}, _PAGES[chunk]
+
+    responses.add_callback(
+        responses.GET, _URL_PAGES, callback=page_for_chunk, content_type="application/json"
+    )
+
+    items = client.iter_chunked(_PAGES_PATH, chunksize=2)
+    assert next(items)["id"] == 1
+    # Page 0 still has an item left to yield, but page 1 is already on its way
+    assert next_page_requested.wait(timeout=5)
+    assert [item["id"] for item in items] == [2, 3]
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_early_close_makes_at_most_one_extra_request(client):
+    """Test stopping early sends at most one extra request and does not wait for it."""
+    requested_chunks = []
+    prefetch_started = threading.Event()
+    release_prefetch = threading.Event()
+    prefetch_done = threading.Event()
+
+    def page_for_chunk(request):
+        chunk = _chunk_of(request)
+        requested_chunks.append(chunk)
+        if chunk == 1:
+            prefetch_started.set()
+            release_prefetch.wait(timeout=5)
+            prefetch_done.set()
+        return 200, {}, _PAGES[chunk]
+
+    responses.add_callback(
+        responses.GET, _URL_PAGES, callback=page_for_chunk, content_type="application/json"
+    )
+
+    items = client.iter_chunked(_PAGES_PATH, chunksize=2)
+    next(items)
+    assert prefetch_started.wait(timeout=5)
+    items.close()
+    # close() returned while the prefetch for page 1 was still in flight
+    assert not prefetch_done.is_set()
+
+    release_prefetch.set()
+    assert prefetch_done.wait(timeout=5)
+    assert requested_chunks == [0, 1]
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_stops_after_full_last_page(client):
+    """Test a full last page ends iteration once chunk metadata shows the total is reached."""
+    for chunk, ids in enumerate(([1, 2], [3, 4])):
+        responses.add(
+            responses.GET,
+            _URL_PAGES,
+            json={"chunk": {"total": 4, "page": chunk, "size": 2}, "items": [{"id": i} for i in ids]},
+            match=[matchers.query_param_matcher({"chunksize": "2", "chunk": str(chunk)})],
+        )
+
+    items = list(client.iter_chunked(_PAGES_PATH, chunksize=2))
+    assert [item["id"] for item in items] == [1, 2, 3, 4]
+    assert len(responses.calls) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_follows_metadata_when_page_size_is_capped(client):
+    """Test short pages are not treated as last when the API caps the page size below chunksize."""
+    for chunk, ids in enumerate(([1, 2], [3, 4], [5])):
+        responses.add(
+            responses.GET,
+            _URL_PAGES,
+            json={"chunk": {"total": 5, "page": chunk, "size": 2}, "items": [{"id": i} for i in ids]},
+            match=[matchers.query_param_matcher({"chunksize": "3", "chunk": str(chunk)})],
+        )
+
+    items = list(client.iter_chunked(_PAGES_PATH, chunksize=3))
+    assert [item["id"] for item in items] == [1, 2, 3, 4, 5]
+    assert len(responses.calls) == 3
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_full_page_without_total_is_last(client):
+    """Test a full page without a total stops iteration instead of guessing at more pages."""
+    responses.add(
+        responses.GET,
+        _URL_PAGES,
+        json={"chunk": {"page": 0, "size": 2}, "items": [{"id": 1}, {"id": 2}]},
+    )
+
+    items = list(client.iter_chunked(_PAGES_PATH, chunksize=2))
+    assert [item["id"] for item in items] == [1, 2]
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.parametrize("chunksize", [0, 20000], ids=["zero", "too_large"])
+def test_iter_chunked_invalid_chunksize(client, chunksize):
+    """Test validation error for chunk sizes outside the API limit."""
+    with pytest.raises(ValueError) as exc:
+        next(client.iter_chunked("/crawls/1/pages", chunksize=chunksize))
+    assert str(exc.value) == f"chunksize must be between 1 and 10,000 (got {chunksize})"
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_unexpected_response_format(client):
     """Test error handling for unexpected response format."""
-    client = AudistoClient(api_key="k", password="p")
-    path = "/crawls/1/pages/"
-    url = "https://api.audisto.com/2.0" + path
+    # Return a list instead of dict
+    responses.add(responses.GET, _URL_PAGES, json=[{"id": 1}], status=200)
+
+    with pytest.raises(RuntimeError) as exc:
+        next(client.iter_chunked(_PAGES_PATH, chunksize=100))
+    assert str(exc.value) == "Unexpected chunked response format"
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_non_dict_items(client):
+    """Test items that are not objects are rejected rather than yielded."""
+    responses.add(responses.GET, _URL_PAGES, json={"items": [1, 2]}, status=200)
+
+    with pytest.raises(RuntimeError) as exc:
+        next(client.iter_chunked(_PAGES_PATH, chunksize=100))
+    assert str(exc.value) == "Unexpected chunked response format"
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_iter_chunked_page_without_chunk_block(client):
+    """Test a full page with no chunk metadata is yielded and treated as the last page."""
+    responses.add(responses.GET, _URL_PAGES, json={"items": [{"id": 1}, {"id": 2}]}, status=200)
+
+    items = list(client.iter_chunked(_PAGES_PATH, chunksize=2))
+    assert [item["id"] for item in items] == [1, 2]
+    assert len(responses.calls) == 1
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_client_without_request_serialization():
+    """Test requests still succeed when the single-request lock is disabled."""
+    assert isinstance(AudistoClient(api_key="k", password="p")._lock, type(threading.Lock()))
+    client = AudistoClient(api_key="k", password="p", serialize_requests=False)
+    assert isinstance(client._lock, contextlib.nullcontext)
+
+    responses.add(responses.GET, _URL_CRAWL_123, json={"domain": "example.com"}, status=200)
+    data = client.get_crawl_summary_v2(123)
+    assert data.domain == "example.com"
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_client_throttles_with_min_request_interval(monkeypatch, clock):
+    """Test consecutive requests are spaced by min_request_interval, but the first one is not delayed."""
+    # A freshly booted host can report a monotonic clock below min_request_interval
+    clock[0] = 5.0
+    sleeps: list[float] = []
+    monkeypatch.setattr("audisto_client.time.sleep", sleeps.append)
+    client = AudistoClient(api_key="k", password="p", cache_ttl=0, min_request_interval=10)
 
-    with responses.RequestsMock() as rsps:
-        # Return a list instead of dict
-        rsps.add(rsps.GET, url, json=[{"id": 1}], status=200)
+    responses.add(responses.GET, _URL_CRAWL_123, json={"domain": "example.com"}, status=200)
+    responses.add(responses.GET, _URL_CRAWL_123, json={"domain": "example.com"}, status=200)
+    client.get_crawl_summary_v2(123)
+    client.get_crawl_summary_v2(123)
 
-        with pytest.raises(RuntimeError, match="Unexpected chunked response format"):
-            list(client.iter_chunked(path, chunksize=100))
+    assert sleeps == [10]